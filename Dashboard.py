@@ -3,39 +3,72 @@ import pandas as pd
 import plotly.express as px
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
-from afeplc_data_scraper import manual_pull 
+from afeplc_data_scraper import manual_pull, retry_api_call, AFE_INDUCT_PORTALS, AFEINDUCT_SCRAPE_CONFIGS
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 
-st.write(st.secrets)
-
 SHEET_NAME = st.secrets["sheet_name"]
 CREDS_PATH = st.secrets["creds_path"]
 GCP_CREDENTIALS = st.secrets["gcp_service_account"]
 
+# Max number of worksheets read from Google Sheets at the same time. Kept small on
+# purpose: the Sheets read quota is per user per minute, so extra workers mostly
+# just reach a 429 sooner. Not tuned against measurements.
+MAX_FETCH_WORKERS = 4
+# How long a loaded worksheet is reused before it is read again (seconds)
+CACHE_TTL = 300
+
+# Charts are always shown in this order, whatever order afe_configs lists them in
+TIMEFRAME_LABELS = {"Min": "Minute", "Hour": "Hourly", "Day": "Daily"}
+
+# Inducts and their timeframes come from the same secrets the scraper uses,
+# so adding an induct only means adding it to afe_portals/afe_configs.
+# Tabs keep the order inducts first appear in afe_configs.
+INDUCT_TIMEFRAMES = {}
+DUPLICATE_CONFIGS = []
+for config in AFEINDUCT_SCRAPE_CONFIGS:
+    timeframes = INDUCT_TIMEFRAMES.setdefault(config["induct"], [])
+    if config["timeframe"] in timeframes:
+        DUPLICATE_CONFIGS.append(f"{config['induct']} {config['timeframe']}")
+    else:
+        timeframes.append(config["timeframe"])
+for timeframes in INDUCT_TIMEFRAMES.values():
+    timeframes.sort(key=list(TIMEFRAME_LABELS).index)
+
+# Inducts set up in only one of the two secrets
+MISSING_PORTALS = [induct for induct in INDUCT_TIMEFRAMES if induct not in AFE_INDUCT_PORTALS]
+MISSING_CONFIGS = [induct for induct in AFE_INDUCT_PORTALS if induct not in INDUCT_TIMEFRAMES]
+
 
 st.set_page_config(layout="wide")
 
 # === Load data from Google Sheets ===
-@st.cache_data(ttl=300)  
-def load_data(SHEET_NAME, worksheet_name):
-    try:
-        scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-        creds = ServiceAccountCredentials.from_json_keyfile_dict(GCP_CREDENTIALS, scope)
-        client = gspread.authorize(creds)
-        sheet = client.open(SHEET_NAME).worksheet(worksheet_name)
-        data = sheet.get_all_records()
-        df = pd.DataFrame(data)
-        # Ensure 'Value' is numeric, change the name of
-        df["Utilization %"] = pd.to_numeric(df["Value"], errors="coerce")
-        df.dropna(subset=["Serialization", "Utilization %"], inplace=True)
-        return True, df
-    except Exception as e:
-        return False, f"Error loading {worksheet_name}: {e}"
+@st.cache_resource(show_spinner=False)
+def open_spreadsheet(SHEET_NAME):
+    # Authorize and look the spreadsheet up once, not once per worksheet
+    scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+    creds = ServiceAccountCredentials.from_json_keyfile_dict(GCP_CREDENTIALS, scope)
+    client = gspread.authorize(creds)
+    return retry_api_call(lambda: client.open(SHEET_NAME))
+
+@st.cache_resource
+def sheet_cache():
+    # Loaded worksheets shared by all sessions: {worksheet_name: (loaded_at, df)}.
+    # Only successful reads are stored, so a failed read is retried on the next run.
+    return {"lock": threading.Lock(), "frames": {}}
+
+def load_data(spreadsheet, worksheet_name):
+    # Runs in the worker threads, so no st.* calls in here; errors are raised
+    sheet = retry_api_call(lambda: spreadsheet.worksheet(worksheet_name))
+    data = retry_api_call(sheet.get_all_records)
+    df = pd.DataFrame(data)
+    # Ensure 'Value' is numeric, change the name of
+    df["Utilization %"] = pd.to_numeric(df["Value"], errors="coerce")
+    df.dropna(subset=["Serialization", "Utilization %"], inplace=True)
+    return df
 
 # === Sidebar Refresh Buttons ===
-inducts = ["Induct 101","Induct 102","Induct 103","Induct 104","Induct 105", "Induct 106", "Induct 107", "Induct 108"]
-timeframes = ["Min", "Hour", "Day"]
-
 st.sidebar.header("📥 Manual Refresh Options")
 
 # Toggle button for value marker annotations
@@ -43,65 +76,76 @@ text_markers = None
 toggle_markers= st.sidebar.toggle("Display Values", value=True, key='B1', help="Turn **on/off** utilization % value markers for a neater display", disabled=False, label_visibility="visible")
 if toggle_markers:         
     text_markers = "Utilization %"
-    markers = True
 
-for induct in inducts:
+for induct, timeframes in INDUCT_TIMEFRAMES.items():
     st.sidebar.markdown(f"**{induct}**")
     for timeframe in timeframes:
-        if st.sidebar.button(f"Refresh {timeframe} Data - {induct}"):
+        if st.sidebar.button(f"Refresh {timeframe} Data - {induct}", disabled=induct in MISSING_PORTALS):
             with st.spinner(f"Pulling {induct} {timeframe} data..."):
                 success, msg = manual_pull(induct, timeframe)
                 if success:
                     st.success(msg)
                     time.sleep(3.5)
-                    st.cache_data.clear()
+                    cache = sheet_cache()
+                    with cache["lock"]:
+                        cache["frames"].pop(f"{induct} {timeframe}", None)
                     st.rerun()
                     
                 else:
                     st.error(msg)
 
-def fetch_data_safe(worksheet_name):
-    success, result = load_data(SHEET_NAME, worksheet_name)
-    if success:
-        return result
-    else:
-        st.warning(result)
-        return pd.DataFrame()
-    
+def fetch_all_data(worksheet_names):
+    # Cached worksheets are picked up here; only the misses are read from Sheets,
+    # in a bounded pool instead of one after another.
+    cache = sheet_cache()
+    now = time.time()
+    data = {}
+    with cache["lock"]:
+        for worksheet_name in worksheet_names:
+            cached = cache["frames"].get(worksheet_name)
+            if cached and now - cached[0] < CACHE_TTL:
+                data[worksheet_name] = cached[1]
+    misses = [name for name in worksheet_names if name not in data]
+    if not misses:
+        return data
+
+    with st.spinner("Loading induct data..."):
+        try:
+            spreadsheet = open_spreadsheet(SHEET_NAME)
+        except Exception as e:
+            st.warning(f"Error opening {SHEET_NAME}: {e}")
+            return {**data, **{name: pd.DataFrame() for name in misses}}
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            futures = {name: executor.submit(load_data, spreadsheet, name) for name in misses}
+
+    for worksheet_name, future in futures.items():
+        try:
+            df = future.result()
+        except Exception as e:
+            st.warning(f"Error loading {worksheet_name}: {e}")
+            df = pd.DataFrame()
+        else:
+            with cache["lock"]:
+                cache["frames"][worksheet_name] = (time.time(), df)
+        data[worksheet_name] = df
+    return data
+
 # === Main Dashboard layout ===
 st.title(":wrench: AFE Induct Data Monitor :rocket:")
 
-induct_101_min_data = fetch_data_safe("Induct 101 Min")
-induct_101_hour_data = fetch_data_safe("Induct 101 Hour")
-induct_101_day_data = fetch_data_safe("Induct 101 Day")
-
-induct_102_min_data = fetch_data_safe("Induct 102 Min")
-induct_102_hour_data = fetch_data_safe("Induct 102 Hour")
-induct_102_day_data = fetch_data_safe("Induct 102 Day")
-
-induct_103_min_data = fetch_data_safe("Induct 103 Min")
-induct_103_hour_data = fetch_data_safe("Induct 103 Hour")
-induct_103_day_data = fetch_data_safe("Induct 103 Day")
-
-induct_104_min_data = fetch_data_safe("Induct 104 Min")
-induct_104_hour_data = fetch_data_safe("Induct 104 Hour")
-induct_104_day_data = fetch_data_safe("Induct 104 Day")
-
-induct_105_min_data = fetch_data_safe("Induct 105 Min")
-induct_105_hour_data = fetch_data_safe("Induct 105 Hour")
-induct_105_day_data = fetch_data_safe("Induct 105 Day")
-
-induct_106_min_data = fetch_data_safe("Induct 106 Min")
-induct_106_hour_data = fetch_data_safe("Induct 106 Hour")
-induct_106_day_data = fetch_data_safe("Induct 106 Day")
+for induct in MISSING_PORTALS:
+    st.warning(f"{induct} has scrape configs but no entry in afe_portals; manual refresh is disabled.")
+for induct in MISSING_CONFIGS:
+    st.warning(f"{induct} is in afe_portals but has no afe_configs entries; it is not shown.")
+for worksheet_name in DUPLICATE_CONFIGS:
+    st.warning(f"{worksheet_name} is listed more than once in afe_configs; only the first entry is used.")
 
-induct_107_min_data = fetch_data_safe("Induct 107 Min")
-induct_107_hour_data = fetch_data_safe("Induct 107 Hour")
-induct_107_day_data = fetch_data_safe("Induct 107 Day")
-
-induct_108_min_data = fetch_data_safe("Induct 108 Min")
-induct_108_hour_data = fetch_data_safe("Induct 108 Hour")
-induct_108_day_data = fetch_data_safe("Induct 108 Day")
+worksheet_names = [
+    f"{induct} {timeframe}"
+    for induct, timeframes in INDUCT_TIMEFRAMES.items()
+    for timeframe in timeframes
+]
+induct_data = fetch_all_data(worksheet_names)
 
 # Make sure all the tabs span the width of the page and arent squashed
 st.markdown("""
@@ -113,315 +157,29 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-tabs_1, tabs_2, tabs_3, tabs_4, tabs_5, tabs_6, tabs_7, tabs_8 = st.tabs(['Induct 101','Induct 102','Induct 103','Induct 104','Induct 105','Induct 106', 'Induct 107', 'Induct 108'])
+tabs = st.tabs(list(INDUCT_TIMEFRAMES))
 
 # === Formatting the formatting ===
 custom_colors_categorical = {'Combi_util': 'hotpink', 'Tote_util': 'orange', 'Tray_util': 'lightblue'}
 
-# === Create Induct 101 ===
-with tabs_1:
-    st.subheader("📊 Induct 101")
-# === Plot Graphs ===
-    # Manually pull Specific induct monitoring data.
-
-    fig_1 = px.line(induct_101_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers= toggle_markers, text= text_markers, title="Induct 101 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        ))
-    
-    st.plotly_chart(fig_1, use_container_width=True, key='A1' )
-
-    fig_2 = px.line(induct_101_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text= text_markers, title="Induct 101 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  
-            y=-0.2,  
-            x=0.5, 
-            xanchor="center"  
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key='A2')
-
-    fig_3 = px.line(induct_101_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 101 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h", 
-            y=-0.2,  
-            x=0.5,  
-            xanchor="center" 
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='A3')
-
-# === Create Induct 102 ===
-with tabs_2:
-    st.subheader("📊 Induct 102")
-# === Plot Graphs ===
-    # Manually pull Specific induct monitoring data.
-
-    fig_1 = px.line(induct_102_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers= toggle_markers, text= text_markers, title="Induct 102 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        ))
-    
-    st.plotly_chart(fig_1, use_container_width=True, key='A4' )
-
-    fig_2 = px.line(induct_102_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text= text_markers, title="Induct 102 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  
-            y=-0.2,  
-            x=0.5, 
-            xanchor="center"  
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key='A5')
-
-    fig_3 = px.line(induct_102_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 102 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h", 
-            y=-0.2,  
-            x=0.5,  
-            xanchor="center" 
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='A6')
-
-# === Create Induct 103 ===
-with tabs_3:
-    st.subheader("📊 Induct 103")
-# === Plot Graphs ===
-    # Manually pull Specific induct monitoring data.
-
-    fig_1 = px.line(induct_103_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers= toggle_markers, text= text_markers, title="Induct 103 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        ))
-    
-    st.plotly_chart(fig_1, use_container_width=True, key='A7' )
-
-    fig_2 = px.line(induct_103_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text= text_markers, title="Induct 103 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  
-            y=-0.2,  
-            x=0.5, 
-            xanchor="center"  
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key='A8')
-
-    fig_3 = px.line(induct_103_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 103 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h", 
-            y=-0.2,  
-            x=0.5,  
-            xanchor="center" 
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='A9')
-
-# === Create Induct 104 ===
-with tabs_4:
-    st.subheader("📊 Induct 104")
-# === Plot Graphs ===
-    # Manually pull Specific induct monitoring data.
-
-    fig_1 = px.line(induct_104_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers= toggle_markers, text= text_markers, title="Induct 104 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        ))
-    
-    st.plotly_chart(fig_1, use_container_width=True, key='A10' )
-
-    fig_2 = px.line(induct_104_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text= text_markers, title="Induct 104 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  
-            y=-0.2,  
-            x=0.5, 
-            xanchor="center"  
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key='A11')
-
-    fig_3 = px.line(induct_104_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 104 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h", 
-            y=-0.2,  
-            x=0.5,  
-            xanchor="center" 
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='A12')
-# === Create Induct 105 ===
-with tabs_5:
-    st.subheader("📊 Induct 105")
-# === Plot Graphs ===
-    # Manually pull Specific induct monitoring data.
-
-    fig_1 = px.line(induct_105_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers= toggle_markers, text= text_markers, title="Induct 105 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        ))
-    
-    st.plotly_chart(fig_1, use_container_width=True, key='A13' )
-
-    fig_2 = px.line(induct_105_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text= text_markers, title="Induct 105 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  
-            y=-0.2,  
-            x=0.5, 
-            xanchor="center"  
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key='A14')
-
-    fig_3 = px.line(induct_105_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 105 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h", 
-            y=-0.2,  
-            x=0.5,  
-            xanchor="center" 
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='A15')
-
-# === Create Induct 106 ===
-with tabs_6:
-    st.subheader("📊 Induct 106")
-    fig_1 = px.line(induct_106_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 106 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center            
-        )
-
-    )
-
-    st.plotly_chart(fig_1, use_container_width=True, key='1' )
-
-    fig_2 = px.line(induct_106_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 106 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key= '2')
-
-    fig_3 = px.line(induct_106_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 106 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='3')
-
-    # === Create Induct 107 ===
-with tabs_7:
-    st.subheader("📊 Induct 107")
-    fig_1 = px.line(induct_107_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 107 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center            
-        )
-
-    )
-
-    st.plotly_chart(fig_1, use_container_width=True, key='4' )
-
-    fig_2 = px.line(induct_107_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 107 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key= '5')
-
-    fig_3 = px.line(induct_107_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 107 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='6')
-
-# === Create Induct 108 ===
-with tabs_8:
-    st.subheader("📊 Induct 108")
-    fig_1 = px.line(induct_108_min_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 108 Minute analysis")
-    fig_1.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center            
-        )
-
-    )
-
-    st.plotly_chart(fig_1, use_container_width=True, key='7' )
-
-    fig_2 = px.line(induct_108_hour_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 108 Hourly analysis")
-    fig_2.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        )
-    )
-    st.plotly_chart(fig_2, use_container_width=True, key= '8')
-
-    fig_3 = px.line(induct_108_day_data, x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title="Induct 108 Daily analysis")
-    fig_3.update_layout(
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            y=-0.2,  # Move legend below the graph
-            x=0.5,  # Center the legend horizontally
-            xanchor="center"  # Align legend to center
-        )
-    )
-    st.plotly_chart(fig_3, use_container_width=True, key='9')
+# === Create a tab per induct ===
+for tab, (induct, timeframes) in zip(tabs, INDUCT_TIMEFRAMES.items()):
+    with tab:
+        st.subheader(f"📊 {induct}")
+        # === Plot Graphs ===
+        for timeframe in timeframes:
+            worksheet_name = f"{induct} {timeframe}"
+            label = TIMEFRAME_LABELS[timeframe]
+            if induct_data[worksheet_name].empty:
+                st.info(f"No data to show for {induct} {label} analysis.")
+                continue
+            fig = px.line(induct_data[worksheet_name], x="Serialization", y="Utilization %", color="Category", color_discrete_map=custom_colors_categorical, markers=toggle_markers, text=text_markers, title=f"{induct} {label} analysis")
+            fig.update_layout(
+                legend=dict(
+                    orientation="h",  # Horizontal legend
+                    y=-0.2,  # Move legend below the graph
+                    x=0.5,  # Center the legend horizontally
+                    xanchor="center"  # Align legend to center
+                )
+            )
+            st.plotly_chart(fig, use_container_width=True, key=worksheet_name)
@@ -11,6 +11,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import time
+import random
 import re
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
@@ -99,7 +100,8 @@ def retry_api_call(func, max_retries=5):
             return func()
         except APIError as e:
             if "429" in str(e):
-                wait = (2 ** attempt) + 1
+                # Jitter so parallel callers that hit the limit together don't retry together
+                wait = (2 ** attempt) + random.uniform(0.5, 1.5)
                 logging.warning(f"Rate limit hit. Retrying in {wait:.1f}s...")
                 time.sleep(wait)
             else: